@@ -3,6 +3,7 @@ Module providing the main command line interface functionality.
 """
 
 from importlib import import_module as import_
+from itertools import chain
 from pathlib import Path
 from sqlite3 import DatabaseError
 from tomllib import TOMLDecodeError, load
@@ -74,7 +75,8 @@ def find_default_config_paths() -> list[Path]:
     # find project config files
     cwd = Path.cwd()
 
-    for path in [cwd] + list(cwd.parents):
+    # walk up lazily instead of materializing all parents up front
+    for path in chain((cwd,), cwd.parents):
         config = path / CONFIG_NAME
 
         if config.exists():
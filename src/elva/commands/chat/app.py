@@ -19,15 +19,20 @@ from textual.widget import Widget
 from textual.widgets import Rule, Static, TabbedContent, TabPane
 from websockets.exceptions import InvalidStatus, WebSocketException
 
+from elva.component import start_components
 from elva.config import Config
 from elva.files import get_data_file_path, get_render_file_path
 from elva.parser import ArrayEventParser, MapEventParser
 from elva.provider import WebsocketProvider
 from elva.renderer import TextRenderer
 from elva.store import SQLiteStore
-from elva.widgets.awareness import AwarenessView
 from elva.widgets.config import ConfigView
-from elva.widgets.screens import Dashboard, ErrorScreen, InputScreen
+from elva.widgets.screens import (
+    Dashboard,
+    DashboardRefresh,
+    ErrorScreen,
+    InputScreen,
+)
 from elva.widgets.ytextarea import YTextArea
 
 log = logging.getLogger(__name__)
@@ -283,7 +288,7 @@ class MessagePreview(Static):
         self.update(RichMarkdown(emoji.emojize(str(self.ytext))))
 
 
-class UI(App):
+class UI(App, DashboardRefresh):
     """
     User interface.
     """
@@ -312,6 +317,12 @@ class UI(App):
         Arguments:
             config: mapping of configuration parameters.
         """
+        # optional components and subscriptions, set when in use
+        self.provider = None
+        self.store = None
+        self.renderer = None
+        self.subscription = None
+
         # structure
         self.ydoc = ydoc = Doc()
         ydoc["history"] = self.history = Array()
@@ -342,10 +353,7 @@ class UI(App):
         self.components = []
 
         if (file := c.get("chat.data")) is not None:
-            self.store = SQLiteStore(
-                self.ydoc,
-                file,
-            )
+            self.store = SQLiteStore(self.ydoc, file)
 
             if c.get("config.dump", False):
                 trimmed = Config(c.deepcopy())
@@ -372,11 +380,7 @@ class UI(App):
             self.components.append(self.provider)
 
         if (file := c.get("render.file")) is not None:
-            self.renderer = TextRenderer(
-                self.history,
-                file,
-                c["render.auto"],
-            )
+            self.renderer = TextRenderer.from_config(self.history, file, c)
             self.components.append(self.renderer)
 
     def get_new_id(self) -> str:
@@ -422,8 +426,10 @@ class UI(App):
         """
         Run all components the chat app needs.
         """
+        # start all components in one worker and wait for them to run
+        self.run_worker(start_components(self.components))
+
         for comp in self.components:
-            self.run_worker(comp.start())
             sub = comp.subscribe()
             while comp.states.RUNNING not in comp.state:
                 await sub.receive()
@@ -435,7 +441,7 @@ class UI(App):
 
         This methods waits for all components to set their `RUNNING` state.
         """
-        if hasattr(self, "provider"):
+        if self.provider is not None:
             self.subscription = self.provider.awareness.observe(
                 self.on_awareness_update
             )
@@ -481,9 +487,9 @@ class UI(App):
 
         It cancels the subscription to changes in the awareness states.
         """
-        if hasattr(self, "subscription"):
+        if self.subscription is not None:
             self.provider.awareness.unobserve(self.subscription)
-            del self.subscription
+            self.subscription = None
 
     async def action_send(self):
         """
@@ -533,7 +539,7 @@ class UI(App):
         """
         await self.provider.stop()
 
-        if type(exc) is InvalidStatus:
+        if isinstance(exc, InvalidStatus):
             response = exc.response
             exc = f"HTTP {response.status_code}: {response.reason_phrase}"
 
@@ -561,15 +567,13 @@ class UI(App):
         """
         Hook called on a change in the awareness states.
 
-        It pushes client states to the dashboard and removes offline client IDs from the future.
+        It removes offline client IDs from the future and pushes client states to the dashboard.
+        Changes arriving while a refresh is already pending are coalesced into it.
 
         Arguments:
             topic: the topic under which the changes are published.
             data: manipulation actions taken as well as the origin of the changes.
         """
-        if self.screen == self.get_screen("dashboard"):
-            self.push_client_states()
-
         actions, origin = data
         removed = actions["removed"]
         for client_id in removed:
@@ -579,6 +583,8 @@ class UI(App):
                 except KeyError:
                     pass
 
+        await self.refresh_client_states()
+
     async def action_save(self):
         """
         Action performed on triggering the `save` key binding.
@@ -607,29 +613,27 @@ class UI(App):
         path = Path(name)
 
         data_file_path = get_data_file_path(path)
+
+        # components to start
+        components = list()
+
         if data_file:
             c["chat.data"] = data_file_path
 
-            self.store = SQLiteStore(
-                self.ydoc,
-                c.get("connect.identifier", self.ydoc.guid),
-                data_file_path,
-            )
-            self.components.append(self.store)
-            self.run_worker(self.store.start())
+            self.store = SQLiteStore(self.ydoc, data_file_path)
+            components.append(self.store)
 
         if c.get("render.file") is None:
             render_file_path = get_render_file_path(data_file_path)
 
             c["render.file"] = render_file_path
 
-            self.renderer = TextRenderer(
-                self.history,
-                render_file_path,
-                c.get("render.auto", True),
-            )
-            self.components.append(self.renderer)
-            self.run_worker(self.renderer.start())
+            self.renderer = TextRenderer.from_config(self.history, render_file_path, c)
+            components.append(self.renderer)
+
+        if components:
+            self.components.extend(components)
+            self.run_worker(start_components(components))
 
         if self.screen == self.get_screen("dashboard"):
             self.push_config()
@@ -638,10 +642,7 @@ class UI(App):
         """
         Action performed on triggering the `render` key binding.
         """
-        # alias
-        c = self.config
-
-        if c.get("render.file") is None:
+        if self.renderer is None:
             self.run_worker(self.get_and_set_file_paths(data_file=False))
         else:
             await self.renderer.write()
@@ -657,23 +658,6 @@ class UI(App):
             self.push_client_states()
             self.push_config()
 
-    def push_client_states(self):
-        """
-        Method pushing the client states to the active dashboard.
-        """
-        if hasattr(self, "provider"):
-            client_states = self.provider.awareness.client_states.copy()
-            client_id = self.provider.awareness.client_id
-            if client_id not in client_states:
-                return
-            states = list()
-            states.append((client_id, client_states.pop(client_id)))
-            states.extend(list(client_states.items()))
-            states = tuple(states)
-
-            awareness_view = self.screen.query_one(AwarenessView)
-            awareness_view.states = states
-
     def push_config(self):
         """
         Method pushing the configuration mapping to the active dashboard.
@@ -2,6 +2,7 @@
 CLI definition.
 """
 
+from contextlib import ExitStack
 from importlib import import_module as import_
 from logging import FileHandler, getLogger
 from typing import Callable
@@ -10,7 +11,7 @@ from click import command, option
 
 from elva.cli import context, data, unset
 from elva.config import Config
-from elva.log import LOGGER_NAME, DefaultFormatter
+from elva.log import LOGGER_NAME, DefaultFormatter, handle_in_background
 
 TRANSLATIONS = {
     "self": "self",
@@ -39,10 +40,12 @@ def run(config: Config) -> None:
     level = config.get("log.level")
     file = config.get("log.file")
 
+    handlers = ExitStack()
+
     if level is not None and file is not None:
         handler = FileHandler(file)
         handler.setFormatter(DefaultFormatter())
-        log.addHandler(handler)
+        handlers.enter_context(handle_in_background(log, handler))
 
         log.setLevel(level)
 
@@ -50,8 +53,9 @@ def run(config: Config) -> None:
     app = import_(".app", __package__)
 
     # init and run app
-    ui = app.UI(config)
-    ui.run()
+    with handlers:
+        ui = app.UI(config)
+        ui.run()
 
     return ui.return_code
 
@@ -4,6 +4,7 @@ App definition.
 
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Literal
 
 from pycrdt import Doc, Text
@@ -12,32 +13,58 @@ from textual.binding import Binding
 from textual.widgets import Footer, Header
 from websockets.exceptions import InvalidStatus, WebSocketException
 
-from elva.component import Component, ComponentState
+from elva.component import Component, ComponentState, start_components
 from elva.config import Config
 from elva.core import FILE_SUFFIX
 from elva.files import get_data_file_path, get_render_file_path
 from elva.provider import WebsocketProvider
 from elva.renderer import TextRenderer
 from elva.store import SQLiteStore
-from elva.widgets.awareness import AwarenessView
 from elva.widgets.config import ConfigView
-from elva.widgets.screens import Dashboard, ErrorScreen, InputScreen
+from elva.widgets.screens import (
+    Dashboard,
+    DashboardRefresh,
+    ErrorScreen,
+    InputScreen,
+)
 from elva.widgets.ytextarea import YTextArea
 
 log = logging.getLogger(__package__)
 
-LANGUAGES = {
-    "py": "python",
-    "md": "markdown",
-    "sh": "bash",
-    "js": "javascript",
-    "rs": "rust",
-    "yml": "yaml",
-}
+LANGUAGES = MappingProxyType(
+    {
+        "py": "python",
+        "md": "markdown",
+        "sh": "bash",
+        "js": "javascript",
+        "rs": "rust",
+        "yml": "yaml",
+    }
+)
 """Supported languages."""
 
 
-class UI(App):
+def get_language_suffix(path: Path) -> str:
+    """
+    Get the suffix preceding the ELVA data file suffix.
+
+    Arguments:
+        path: the path to the data file.
+
+    Returns:
+        the suffix without leading dot or an empty string if there is none.
+    """
+    if path.suffix != FILE_SUFFIX:
+        return ""
+
+    # the stem holds the file name without the data file suffix
+    head, sep, suffix = path.stem.rpartition(".")
+
+    # a leading dot denotes a hidden file, not a suffix
+    return suffix if head else ""
+
+
+class UI(App, DashboardRefresh):
     """
     User interface.
     """
@@ -64,6 +91,12 @@ class UI(App):
         Arguments:
             config: mapping of configuration parameters to their values.
         """
+        # optional components and subscriptions, set when in use
+        self.provider = None
+        self.store = None
+        self.renderer = None
+        self.subscription = None
+
         # document structure
         self.ydoc = Doc()
         self.ytext = Text()
@@ -117,10 +150,7 @@ class UI(App):
             self.components.append(self.provider)
 
         if (file := c.get("editor.data")) is not None:
-            self.store = SQLiteStore(
-                self.ydoc,
-                file,
-            )
+            self.store = SQLiteStore(self.ydoc, file)
 
             if c.get("config.dump", False):
                 trimmed = Config(c.deepcopy())
@@ -133,12 +163,7 @@ class UI(App):
             self.components.append(self.store)
 
         if (file := c.get("render.file")) is not None:
-            self.renderer = TextRenderer(
-                self.ytext,
-                file,
-                auto_save=c["render.auto"],
-                timeout=c["render.timeout"],
-            )
+            self.renderer = TextRenderer.from_config(self.ytext, file, c)
             self.components.append(self.renderer)
 
         self._language = c.get("editor.language")
@@ -166,7 +191,7 @@ class UI(App):
         """
         await self.provider.stop()
 
-        if type(exc) is InvalidStatus:
+        if isinstance(exc, InvalidStatus):
             response = exc.response
             exc = f"HTTP {response.status_code}: {response.reason_phrase}"
 
@@ -196,13 +221,13 @@ class UI(App):
         Hook called on a change in the awareness states.
 
         It pushes client states to the dashboard.
+        Changes arriving while a refresh is already pending are coalesced into it.
 
         Arguments:
             topic: the topic under which the changes are published.
             data: manipulation actions taken as well as the origin of the changes.
         """
-        if self.screen == self.get_screen("dashboard"):
-            self.push_client_states()
+        await self.refresh_client_states()
 
     async def wait_for_component_state(
         self, component: Component, state: ComponentState
@@ -223,7 +248,7 @@ class UI(App):
         """
         Hook called on mounting the app.
         """
-        if hasattr(self, "provider"):
+        if self.provider is not None:
             self.subscription = self.provider.awareness.observe(
                 self.on_awareness_update
             )
@@ -246,12 +271,15 @@ class UI(App):
                 with render_file_path.open(mode="r") as fd:
                     text = fd.read()
 
-        # wait for components to run
+        # start all components in one worker and wait for them to run;
+        # components might have added further states in the meantime
+        self.run_worker(start_components(self.components))
+
         for comp in self.components:
-            self.run_worker(comp.start())
-            await self.wait_for_component_state(
-                comp, comp.states.ACTIVE | comp.states.RUNNING
-            )
+            sub = comp.subscribe()
+            while comp.states.RUNNING not in comp.state:
+                await sub.receive()
+            comp.unsubscribe(sub)
 
         # now add the text to save updates to disk and send them over wire
         if text:
@@ -262,9 +290,9 @@ class UI(App):
         """
         Hook called on unmounting the app.
         """
-        if hasattr(self, "subscription"):
+        if self.subscription is not None:
             self.provider.awareness.unobserve(self.subscription)
-            del self.subscription
+            self.subscription = None
 
         for comp in self.components:
             await self.wait_for_component_state(comp, comp.states.NONE)
@@ -273,7 +301,7 @@ class UI(App):
         """
         Hook arranging child widgets.
         """
-        if hasattr(self, "provider"):
+        if self.provider is not None:
             awareness = self.provider.awareness
         else:
             awareness = None
@@ -300,16 +328,16 @@ class UI(App):
         file_path = c.get("editor.data")
 
         if file_path is not None and file_path.suffix:
-            suffixes = "".join(file_path.suffixes)
-            suffix = suffixes.split(FILE_SUFFIX)[0].removeprefix(".")
-            if str(file_path).endswith(suffix):
+            suffix = get_language_suffix(file_path)
+            if not suffix:
                 log.info("continuing without syntax highlighting")
             else:
-                try:
-                    language = LANGUAGES[suffix]
+                language = LANGUAGES.get(suffix)
+
+                if language is not None:
                     log.info(f"enabled {language} syntax highlighting")
                     return language
-                except KeyError:
+                else:
                     log.info(
                         f"no syntax highlighting available for file type '{suffix}'"
                     )
@@ -345,28 +373,25 @@ class UI(App):
 
         data_file_path = get_data_file_path(path)
 
+        # components to start
+        components = list()
+
         if data_file:
             c["editor.data"] = data_file_path
-            self.store = SQLiteStore(
-                self.ydoc,
-                c.get("connect.identifier", self.ydoc.guid),
-                data_file_path,
-            )
-            self.components.append(self.store)
-            self.run_worker(self.store.start())
+            self.store = SQLiteStore(self.ydoc, data_file_path)
+            components.append(self.store)
 
         if c.get("render.file") is None:
             render_file_path = get_render_file_path(data_file_path)
 
             c["render.file"] = render_file_path
 
-            self.renderer = TextRenderer(
-                self.ytext,
-                render_file_path,
-                c.get("render.auto", False),
-            )
-            self.components.append(self.renderer)
-            self.run_worker(self.renderer.start())
+            self.renderer = TextRenderer.from_config(self.ytext, render_file_path, c)
+            components.append(self.renderer)
+
+        if components:
+            self.components.extend(components)
+            self.run_worker(start_components(components))
 
         if self.screen == self.get_screen("dashboard"):
             self.push_config()
@@ -375,7 +400,7 @@ class UI(App):
         """
         Action performed on triggering the `render` key binding.
         """
-        if self.config.get("render.file") is None:
+        if self.renderer is None:
             self.run_worker(self.get_and_set_file_paths(data_file=False))
         else:
             await self.renderer.write()
@@ -391,23 +416,6 @@ class UI(App):
             self.push_client_states()
             self.push_config()
 
-    def push_client_states(self):
-        """
-        Method pushing the client states to the active dashboard.
-        """
-        if hasattr(self, "provider"):
-            client_states = self.provider.awareness.client_states.copy()
-            client_id = self.provider.awareness.client_id
-            if client_id not in client_states:
-                return
-            states = list()
-            states.append((client_id, client_states.pop(client_id)))
-            states.extend(list(client_states.items()))
-            states = tuple(states)
-
-            awareness_view = self.screen.query_one(AwarenessView)
-            awareness_view.states = states
-
     def push_config(self):
         """
         Method pushing the configuration mapping to the active dashboard.
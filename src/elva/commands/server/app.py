@@ -2,6 +2,8 @@
 App definition.
 """
 
+import asyncio
+
 from anyio import create_task_group
 from websockets.asyncio.server import basic_auth
 
@@ -21,11 +23,20 @@ async def main(config: Config):
     """
     c = config
 
+    loop = asyncio.get_running_loop()
+
+    # run new tasks synchronously until they suspend for the first time,
+    # saving one event loop iteration per task; available from Python 3.12 on
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     host = c.get("server.host", "0.0.0.0")
     port = c.get("server.port") or free_tcp_port()
     save = c.get("server.save", False)
     directory = c.get("server.directory")
     dummy = c.get("server.dummy", False)
+    max_connections = c.get("server.max_connections")
+    max_room_connections = c.get("server.max_room_connections")
 
     if dummy:
         process_request = DummyAuth().check
@@ -45,6 +56,8 @@ async def main(config: Config):
         path=directory,
         process_request=process_request,
         tls_config=c.get("tls", {}),
+        max_connections=max_connections,
+        max_room_connections=max_room_connections,
     )
 
     async with create_task_group() as tg:
@@ -7,12 +7,12 @@ from importlib import import_module as import_
 from logging import INFO, FileHandler, StreamHandler, getLogger
 from pathlib import Path
 
-from click import INT, UsageError, command, option
+from click import INT, IntRange, UsageError, command, option
 from click import Path as PathParamType
 
 from elva.cli import context, unset
 from elva.config import Config
-from elva.log import LOGGER_NAME, DefaultFormatter
+from elva.log import LOGGER_NAME, DefaultFormatter, handle_in_background
 
 TRANSLATIONS = {
     "host": "host",
@@ -24,6 +24,8 @@ TRANSLATIONS = {
     "directory": "directory",
     "d": "directory",
     "dummy": "dummy",
+    "max-connections": "max_connections",
+    "max-room-connections": "max_room_connections",
 }
 """
 Table for translation from flag to parameter names.
@@ -46,7 +48,6 @@ def run(config: Config) -> None:
     else:
         handler = StreamHandler(sys.stdout)
     handler.setFormatter(DefaultFormatter())
-    log.addHandler(handler)
 
     level = config.get("log.level", INFO)
     log.setLevel(level)
@@ -57,12 +58,21 @@ def run(config: Config) -> None:
     # run app, catch file permission errors with an appropriate message
     anyio = import_("anyio")
 
+    # run on the faster uvloop event loop if it is installed
     try:
-        anyio.run(app.main, config)
-    except PermissionError as exc:
-        raise UsageError(exc)
-    except KeyboardInterrupt:
-        pass
+        import_("uvloop")
+    except ImportError:
+        backend_options = {}
+    else:
+        backend_options = {"use_uvloop": True}
+
+    with handle_in_background(log, handler):
+        try:
+            anyio.run(app.main, config, backend_options=backend_options)
+        except PermissionError as exc:
+            raise UsageError(exc)
+        except KeyboardInterrupt:
+            pass
 
 
 @command(name="server")
@@ -101,6 +111,18 @@ def run(config: Config) -> None:
         allow_dash=False,
     ),
 )
+@option(
+    "--max-connections",
+    "max_connections",
+    help="Maximum number of connections handled at once. Unlimited by default.",
+    type=IntRange(min=1),
+)
+@option(
+    "--max-room-connections",
+    "max_room_connections",
+    help="Maximum number of connections per document handled at once. Unlimited by default.",
+    type=IntRange(min=1),
+)
 @option(
     "--dummy",
     help="Enable Dummy Basic Authentication. DO NOT USE IN PRODUCTION.",
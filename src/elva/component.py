@@ -7,17 +7,17 @@ from contextlib import AsyncExitStack
 from enum import Flag
 from types import TracebackType
 from typing import Awaitable, Iterable, Self
+from weakref import finalize
 
 from anyio import (
     TASK_STATUS_IGNORED,
     BrokenResourceError,
     CancelScope,
-    Lock,
+    Event,
     WouldBlock,
     create_memory_object_stream,
     create_task_group,
     get_cancelled_exc_class,
-    sleep_forever,
 )
 from anyio.abc import TaskGroup, TaskStatus
 from anyio.streams.memory import MemoryObjectReceiveStream
@@ -50,6 +50,19 @@ ComponentState = create_component_state("ComponentState")
 """The default component states."""
 
 
+def _close_subscribers(subscribers: dict):
+    """
+    Close and remove all sending streams from a mapping of subscribers.
+
+    Arguments:
+        subscribers: mapping of receiving streams to their respective sending stream.
+    """
+    for send in subscribers.values():
+        send.close()
+
+    subscribers.clear()
+
+
 class Component:
     """
     Generic asynchronous app component class.
@@ -63,7 +76,6 @@ class Component:
     """
 
     _task_group: TaskGroup | None = None
-    _start_lock: Lock | None = None
 
     log: logging.Logger
     """Logger instance to write logging messages to."""
@@ -76,12 +88,19 @@ class Component:
         name = LOGGER_NAME.get(self.__module__)
         self.log = logging.getLogger(f"{name}.{self.__class__.__name__}")
 
-        # level is inherited from parent logger
-        self.log.setLevel(logging.NOTSET)
+        # level is inherited from parent logger;
+        # loggers are shared per name and setting a level clears the level cache
+        # of all loggers, so only reset it when it has been changed
+        if self.log.level != logging.NOTSET:
+            self.log.setLevel(logging.NOTSET)
 
         # setup empty subscriber mapping
         self._subscribers = dict()
 
+        # close all subscriptions before this component gets deleted;
+        # unlike `__del__`, the finalizer holds no reference to the component
+        finalize(self, _close_subscribers, self._subscribers)
+
         # set default state of every component
         self._state = self.states.NONE
 
@@ -108,6 +127,10 @@ class Component:
         """
         Get an object to listen on for differences in component state.
 
+        If the subscriber falls behind by more than 8192 differences, the oldest
+        ones are dropped. It can always catch up by reading
+        [`state`][elva.component.Component.state].
+
         Returns:
             the receiving end of an asynchronous memory object stream emitting
                 tuple of deleted and added states.
@@ -120,7 +143,7 @@ class Component:
 
         # set the receiving end as key so that it can easily be unsubscribed
         self._subscribers[recv] = send
-        self.log.info(f"added subscriber {id(recv)}")
+        self.log.info("added subscriber %d", id(recv))
 
         return recv
 
@@ -134,7 +157,7 @@ class Component:
         """
         send = self._subscribers.pop(recv)
         send.close()
-        self.log.info(f"removed subscriber {id(recv)}")
+        self.log.info("removed subscriber %d", id(recv))
 
     def _change_state(self, from_state: Flag, to_state: Flag):
         """
@@ -146,35 +169,61 @@ class Component:
             from_state: the state to remove.
             to_state: the state to insert.
         """
+        # compare and combine the raw integer values,
+        # which avoids the comparatively slow `Flag` operator methods
+        from_value = from_state.value
+        to_value = to_state.value
+
         # no change in state
-        if from_state == to_state:
+        if from_value == to_value:
             return
 
         # remove `from_state`, add `to_state`
-        state = self.state & ~from_state | to_state
+        state = self.states(self._state.value & ~from_value | to_value)
 
         # set the state from the component's states
         self._state = state
-        self.log.info(f"set state to {state}")
+        self.log.info("set state to %s", state)
 
-        if from_state != self.states.NONE:
-            self.log.info(f"removed state {from_state}")
+        # `NONE` is the zero flag in every component state enumeration,
+        # so there is no need to look it up via `states`
+        if from_value:
+            self.log.info("removed state %s", from_state)
 
-        if to_state != self.states.NONE:
-            self.log.info(f"added state {to_state}")
+        if to_value:
+            self.log.info("added state %s", to_state)
 
-        # copy to avoid exceptions due to set changes during iteration
-        subs = self._subscribers.copy()
+        # nobody to notify, e.g. for components without listeners
+        if not self._subscribers:
+            return
+
+        # subscribers to remove after iterating,
+        # as the mapping must not change during iteration
+        dead = None
+
+        diff = (from_state, to_state)
 
         # send the state diff to the subscribers
-        for recv, send in subs.items():
+        for recv, send in self._subscribers.items():
             try:
-                send.send_nowait((from_state, to_state))
-                self.log.debug(f"sent state change to subscriber {id(recv)}")
-            except (BrokenResourceError, WouldBlock):
-                # either the send stream has a respective closed receive stream
-                # or the stream buffer is full, so it is not in use either way
-                # and we unsubscribe ourselves
+                try:
+                    send.send_nowait(diff)
+                except WouldBlock:
+                    # the stream buffer is full as the subscriber lags behind,
+                    # so drop its oldest diff to make room for the newest one
+                    recv.receive_nowait()
+                    send.send_nowait(diff)
+
+                self.log.debug("sent state change to subscriber %d", id(recv))
+            except BrokenResourceError:
+                # the send stream has a respective closed receive stream,
+                # so it is not in use anymore and we unsubscribe it
+                if dead is None:
+                    dead = []
+                dead.append(recv)
+
+        if dead is not None:
+            for recv in dead:
                 self.unsubscribe(recv)
 
     def close(self):
@@ -185,22 +234,6 @@ class Component:
         for recv in subs:
             self.unsubscribe(recv)
 
-    def __del__(self):
-        """
-        Destructor callback.
-
-        It closes all subscriptions before this component gets deleted.
-        """
-        self.close()
-
-    def _get_start_lock(self) -> Lock:
-        """
-        Get a starting lock to enter the task group exclusively.
-        """
-        if self._start_lock is None:
-            self._start_lock = Lock()
-        return self._start_lock
-
     async def __aenter__(self) -> Self:
         """
         Asynchronous context manager enter callback.
@@ -211,21 +244,22 @@ class Component:
         if self._task_group is not None:
             raise RuntimeError(f"{self} already active")
 
-        async with self._get_start_lock():
-            # enter the asynchronous context and start the runner in it
-            self._exit_stack = AsyncExitStack()
-            await self._exit_stack.__aenter__()
-            self._task_group = await self._exit_stack.enter_async_context(
-                create_task_group()
-            )
+        # claim the component before the first await, so that concurrent
+        # starts fail the check above without needing a lock
+        self._task_group = create_task_group()
 
-            self.log.info("starting")
+        # enter the asynchronous context and start the runner in it
+        self._exit_stack = AsyncExitStack()
+        await self._exit_stack.__aenter__()
+        await self._exit_stack.enter_async_context(self._task_group)
 
-            # add `ACTIVE` state
-            self._change_state(self.states.NONE, self.states.ACTIVE)
+        self.log.info("starting")
 
-            # start the main coroutine
-            await self._task_group.start(self._run)
+        # add `ACTIVE` state
+        self._change_state(self.states.NONE, self.states.ACTIVE)
+
+        # start the main coroutine
+        await self._task_group.start(self._run)
 
         return self
 
@@ -277,8 +311,10 @@ class Component:
             await self.run()
 
             # keep the task running when `self.run()` has finished
-            # so the cancellation exception can be always caught
-            await sleep_forever()
+            # so the cancellation exception can be always caught;
+            # waiting on an event that is never set schedules no timer,
+            # unlike `sleep_forever` on asyncio
+            await Event().wait()
         except get_cancelled_exc_class():
             self.log.info("stopping")
             with CancelScope(shield=True):
@@ -306,18 +342,19 @@ class Component:
         if self._task_group is not None:
             raise RuntimeError(f"{self} already active")
 
-        async with self._get_start_lock():
-            async with create_task_group() as self._task_group:
-                self.log.info("starting")
+        # claim the component before the first await, so that concurrent
+        # starts fail the check above without needing a lock
+        self._task_group = create_task_group()
 
-                # add `ACTIVE` state
-                self._change_state(self.states.NONE, self.states.ACTIVE)
+        async with self._task_group:
+            self.log.info("starting")
 
-                # start the main coroutine
-                await self._task_group.start(self._run)
+            # add `ACTIVE` state
+            self._change_state(self.states.NONE, self.states.ACTIVE)
 
-                # signal that the coroutine has started
-                task_status.started()
+            # start the main coroutine and let it signal
+            # directly that the component has started
+            self._task_group.start_soon(self._run, task_status)
 
     async def stop(self):
         """
@@ -364,3 +401,18 @@ class Component:
         It is defined as a no-op and supposed to be implemented in the inheriting class.
         """
         ...
+
+
+async def start_components(components: Iterable[Component]):
+    """
+    Start components concurrently within a single task group.
+
+    If one of the components fails to start, the others are cancelled
+    and cleaned up before the exception is raised.
+
+    Arguments:
+        components: the components to start.
+    """
+    async with create_task_group() as tg:
+        for component in components:
+            tg.start_soon(component.start)
@@ -26,9 +26,12 @@ if __name__ == "__main__":
 ```
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 from enum import IntEnum
-from logging import DEBUG, INFO, Formatter
+from logging import DEBUG, INFO, Formatter, Handler, Logger, LogRecord, handlers
+from queue import Empty, Full, Queue
 
 LOGGER_NAME: ContextVar = ContextVar("logger_name")
 """
@@ -38,6 +41,12 @@ This variable is read by the Component class on initialization.
 """
 
 
+QUEUE_SIZE = 10000
+"""
+Default maximum number of log records waiting to be handled in the background.
+"""
+
+
 class LogLevel(IntEnum):
     """
     Enumeration of `logging` log levels.
@@ -74,3 +83,88 @@ class DefaultFormatter(Formatter):
         datefmt = "%Y-%m-%d %H:%M:%S"
 
         super().__init__(fmt=fmt, datefmt=datefmt)
+
+
+class QueueHandler(handlers.QueueHandler):
+    """
+    Handler putting log records into a bounded queue.
+
+    When the queue is full, the oldest waiting record is dropped in favor of the new one,
+    so that logging never blocks.
+    """
+
+    def enqueue(self, record: LogRecord):
+        """
+        Put a log record into the queue, dropping the oldest one if the queue is full.
+
+        Arguments:
+            record: the log record to put into the queue.
+        """
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except Full:
+                try:
+                    self.queue.get_nowait()
+                except Empty:
+                    pass
+
+
+class QueueListener(handlers.QueueListener):
+    """
+    Listener handling log records from a bounded queue in a separate thread.
+    """
+
+    def enqueue_sentinel(self):
+        """
+        Put the stop signal into the queue, waiting for a free slot if the queue is full.
+        """
+        self.queue.put(self._sentinel)
+
+
+@contextmanager
+def handle_in_background(
+    log: Logger, handler: Handler, maxsize: int = QUEUE_SIZE
+) -> Iterator[QueueHandler]:
+    """
+    Let a handler process the log records of a logger in a separate thread.
+
+    Writing log records to files or streams blocks the calling thread.
+    Within this context, log calls only put records into a queue instead,
+    so that they don't block the event loop of an app.
+
+    On exit, the logger stops passing records to the queue,
+    waiting records are handled and the handler is closed.
+
+    Example:
+
+    ```python
+    handler = logging.FileHandler("./some.log")
+    handler.setFormatter(DefaultFormatter())
+
+    with handle_in_background(log, handler):
+        ...
+    ```
+
+    Arguments:
+        log: the logger to add the queue handler to.
+        handler: the handler to process log records with.
+        maxsize: the maximum number of log records waiting to be handled.
+
+    Yields:
+        the handler added to the logger.
+    """
+    queue = Queue(maxsize)
+    listener = QueueListener(queue, handler, respect_handler_level=True)
+    listener.start()
+
+    queue_handler = QueueHandler(queue)
+    log.addHandler(queue_handler)
+
+    try:
+        yield queue_handler
+    finally:
+        log.removeHandler(queue_handler)
+        listener.stop()
+        handler.close()
@@ -43,23 +43,22 @@ class IndexBasedEventParser:
 
         # `event.delta` is a list of edits
         for edit in event.delta:
-            if "retain" in edit:
+            # look up each key only once per edit
+            if (retain := edit.get("retain")) is not None:
                 # we are about to move the cursor to a new edit;
                 # perform the current edit first
                 if kwargs:
                     self._on_edit(txn=txn, **kwargs)
 
                 # move the cursor
-                cursor += edit["retain"]
+                cursor += retain
 
                 # renew kwargs for the new edit
                 kwargs = dict(retain=cursor)
-            elif "insert" in edit:
+            elif (insert := edit.get("insert")) is not None:
                 # the cursor only moves on insertion respecting a present deletion,
                 # but not on deletion only
-                cursor += self._get_insertion_length(edit["insert"]) - kwargs.get(
-                    "delete", 0
-                )
+                cursor += self._get_insertion_length(insert) - kwargs.get("delete", 0)
 
                 # update kwargs for the current edit
                 kwargs.update(edit)
@@ -80,7 +80,7 @@ def read_var_uint(data: bytes) -> tuple[int, int]:
     return uint, byte_idx
 
 
-def prepend_var_uint(data: bytes) -> tuple[bytes, int]:
+def prepend_var_uint(data: bytes, prefix: bytes = b"") -> tuple[bytes, int]:
     """
     Prepend the length of `data` as variable unsigned integer to `data`.
 
@@ -88,14 +88,16 @@ def prepend_var_uint(data: bytes) -> tuple[bytes, int]:
 
     Arguments:
         data: the payload of a Y protocol message.
+        prefix: bytes to put in front of the variable unsigned integer, e.g. magic bytes.
 
     Returns:
-        A tuple of two values: `data` with the variable unsigned integer prepended and the length of `data`.
+        A tuple of two values: `data` with `prefix` and the variable unsigned integer prepended and the length of `data`.
     """
     len_data = len(data)
     res = write_var_uint(len_data)
 
-    return bytes(res) + data, len_data
+    # join all parts at once to copy `data` only a single time
+    return b"".join((prefix, bytes(res), data)), len_data
 
 
 def strip_var_uint(data: bytes) -> tuple[bytes, int]:
@@ -190,8 +192,7 @@ class Message(YCodec, Enum):
         Returns:
             A tuple of two objects: the encoded payload with the message type's magic bytes prepended and the length of bytes being processed.
         """
-        message, length = super().encode(payload, errors=errors)
-        return self.magic_bytes + message, length
+        return prepend_var_uint(payload, prefix=self.magic_bytes)
 
     def decode(self, message: bytes, errors: str = "strict") -> tuple[bytes, int]:
         """
@@ -238,22 +239,25 @@ class Message(YCodec, Enum):
         # there might be no second magic byte
         mb2_off = 0
 
-        mb1, mb1_off = read_var_uint(message)
+        # slice a view on `message` to not copy it, only the payload is copied
+        view = memoryview(message)
+
+        mb1, mb1_off = read_var_uint(view)
 
         try:
             if mb1 == 1:
                 # awareness message is the only type with a single magic byte
                 ymsg = cls((mb1,))
             else:
-                mb2, mb2_off = read_var_uint(message[mb1_off:])
+                mb2, mb2_off = read_var_uint(view[mb1_off:])
                 ymsg = cls((mb1, mb2))
         except ValueError:
             raise ValueError(
                 f"Message with magic bytes {mb1}, {mb2} is not a valid {cls.__name__}"
             ) from None
 
-        payload, length = ymsg._decode(message[mb1_off + mb2_off :], errors=errors)
-        return ymsg, payload, mb1_off + mb2_off + length
+        payload, length = ymsg._decode(view[mb1_off + mb2_off :], errors=errors)
+        return ymsg, bytes(payload), mb1_off + mb2_off + length
 
 
 ##
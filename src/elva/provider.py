@@ -273,7 +273,7 @@ class WebsocketProvider(Component):
                 # same as hasattr(self, "_connection")
                 if self.states.CONNECTED in self.state:
                     await self._connection.send(message)
-                    self.log.debug(f"sent message {message}")
+                    self.log.debug("sent message %s", message)
 
         # same as hasattr(self, "_connection")
         if self.states.CONNECTED in self.state:
@@ -290,7 +290,7 @@ class WebsocketProvider(Component):
         try:
             async for message in self._buffer_out:
                 await self._connection.send(message)
-                self.log.debug(f"sent message {message}")
+                self.log.debug("sent message %s", message)
         except ConnectionClosed:
             pass
 
@@ -302,7 +302,7 @@ class WebsocketProvider(Component):
         self.log.info("listening for incoming data")
         try:
             async for data in self._connection:
-                self.log.debug(f"received data {data}")
+                self.log.debug("received data %s", data)
                 await self._on_recv(data)
         except ConnectionClosed:
             pass
@@ -390,7 +390,7 @@ class WebsocketProvider(Component):
         try:
             message_type, payload, _ = YMessage.infer_and_decode(data)
         except Exception as exc:
-            self.log.debug(f"failed to infer message: {exc}")
+            self.log.debug("failed to infer message: %s", exc)
             return
 
         match message_type:
@@ -2,7 +2,9 @@
 Module holding renderer components.
 """
 
+from collections.abc import Mapping
 from hashlib import md5
+from typing import Self
 
 from anyio import TASK_STATUS_IGNORED, CancelScope, Path, open_file, sleep
 from anyio.abc import TaskStatus
@@ -65,6 +67,31 @@ class TextRenderer(Component):
         self.timeout = timeout
         self.hash = md5()
 
+    @classmethod
+    def from_config(
+        cls,
+        crdt: Text | Array | Map | XmlFragment | XmlElement | XmlText,
+        path: str,
+        config: Mapping,
+    ) -> Self:
+        """
+        Create a renderer with the options from the `render` section of a configuration.
+
+        Arguments:
+            crdt: instance of a Y CRDT.
+            path: the filepath to write content to.
+            config: the configuration mapping to read `render.auto` and `render.timeout` from.
+
+        Returns:
+            the renderer component.
+        """
+        return cls(
+            crdt,
+            path,
+            auto_save=config.get("render.auto", True),
+            timeout=config.get("render.timeout", 300),
+        )
+
     @property
     def states(self) -> TextRendererState:
         """
@@ -136,13 +163,8 @@ class TextRenderer(Component):
         # get content after as it would be written to file
         content = self.get_content()
 
-        # copy the hash algorithm (and included content)
-        hash = self.hash.copy()
-
-        # update the copied hash
-        hash.update(content.encode())
-
-        if hash.digest() != self.hash.digest():
+        # compare against the digest of the last written content
+        if md5(content.encode()).digest() != self.hash.digest():
             # the new content differs from the one on the last write;
             # remove the `SAVED` state
             self._change_state(self.states.SAVED, self.states.NONE)
@@ -203,8 +225,8 @@ class TextRenderer(Component):
             # now we can run calls after finish
             self.log.info(f"wrote to file {self.path}")
 
-            # update the hash of the freshly written content
-            self.hash.update(content.encode())
+            # replace the hash with the one of the freshly written content
+            self.hash = md5(content.encode())
             self.log.debug(f"updated hash to {self.hash.hexdigest()}")
 
             # update state
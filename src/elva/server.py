@@ -158,8 +158,13 @@ class Room(Component):
     path: None | Path
     """Path where to save a Y Document on disk."""
 
-    clients: set[ServerConnection]
-    """Set of active connections."""
+    clients: tuple[ServerConnection, ...]
+    """
+    Snapshot of active connections.
+
+    It is replaced instead of mutated on changes, so it can be iterated
+    without copying.
+    """
 
     ydoc: Doc
     """Y Document instance holding received updates."""
@@ -195,7 +200,7 @@ class Room(Component):
         else:
             self.path = None
 
-        self.clients = set()
+        self.clients = tuple()
 
         if persistent:
             self.ydoc = Doc()
@@ -223,16 +228,13 @@ class Room(Component):
         Used to close all client connections gracefully.
         The store is closed automatically and calls its cleanup method separately.
         """
-        clients = self.clients.copy()
+        clients = self.clients
         async with anyio.create_task_group() as tg:
             for client in clients:
                 tg.start_soon(client.close)
 
         for client in clients:
-            try:
-                self.remove(client)
-            except KeyError:
-                pass
+            self.remove(client)
 
         self.log.info("closed all connections")
 
@@ -243,19 +245,24 @@ class Room(Component):
         Arguments:
             client: connection to add the list of connections.
         """
-        nclients = len(self.clients)
-        self.clients.add(client)
-        if nclients < len(self.clients):
+        if client not in self.clients:
+            self.clients += (client,)
             self.log.info(f"added connection {id(client)}")
 
     def remove(self, client: ServerConnection):
         """
         Remove a client connection.
 
+        Nothing happens if `client` has already been removed, e.g. by
+        [`cleanup`][elva.server.Room.cleanup] before the connection handler finishes.
+
         Arguments:
             client: connection to remove from the list of connections.
         """
-        self.clients.remove(client)
+        if client not in self.clients:
+            return
+
+        self.clients = tuple(other for other in self.clients if other is not client)
         self.log.info(f"removed connection {id(client)}")
 
     def broadcast(self, data: bytes, client: ServerConnection):
@@ -266,14 +273,20 @@ class Room(Component):
             data: data to send.
             client: connection from which `data` came and thus to exclude from broadcasting.
         """
-        # copy current state of clients and remove calling client
-        clients = self.clients.copy()
-        clients.remove(client)
+        # nobody else to send to, e.g. when editing alone
+        if len(self.clients) < 2:
+            return
+
+        # take the current snapshot of clients without the calling client;
+        # with at least two clients in the room, there is always someone left
+        clients = [other for other in self.clients if other is not client]
 
-        if clients:
-            # broadcast to all other clients
-            # TODO: set raise_exceptions=True and catch with ExceptionGroup
-            broadcast(clients, data)
+        # broadcast to all other clients
+        # TODO: set raise_exceptions=True and catch with ExceptionGroup
+        broadcast(clients, data)
+
+        # avoid formatting the message on every broadcast when not debugging
+        if self.log.isEnabledFor(logging.DEBUG):
             client_ids = set(id(client) for client in clients)
             self.log.debug(f"broadcasted {data} from {id(client)} to {client_ids}")
 
@@ -293,17 +306,22 @@ class Room(Component):
         if self.persistent:
             # properly dispatch message
             try:
-                message_type, payload, _ = YMessage.infer_and_decode(data)
+                message_type, payload, length = YMessage.infer_and_decode(data)
             except ValueError:
                 return
 
+            # `data` can be forwarded as is if it holds nothing but the message
+            message = data if length == len(data) else None
+
             match message_type:
                 case YMessage.SYNC_STEP1:
                     await self.process_sync_step1(payload, client)
-                case YMessage.SYNC_STEP2 | YMessage.SYNC_UPDATE:
+                case YMessage.SYNC_STEP2:
                     await self.process_sync_update(payload, client)
+                case YMessage.SYNC_UPDATE:
+                    await self.process_sync_update(payload, client, message=message)
                 case YMessage.AWARENESS:
-                    await self.process_awareness(payload, client)
+                    await self.process_awareness(payload, client, message=message)
         else:
             # simply forward incoming messages to all other clients
             self.broadcast(data, client)
@@ -329,7 +347,12 @@ class Room(Component):
         message, _ = YMessage.SYNC_STEP1.encode(state)
         await client.send(message)
 
-    async def process_sync_update(self, update: bytes, client: ServerConnection):
+    async def process_sync_update(
+        self,
+        update: bytes,
+        client: ServerConnection,
+        message: None | bytes = None,
+    ):
         """
         Process a sync update message payload `update` from `client`.
 
@@ -338,20 +361,35 @@ class Room(Component):
         Arguments:
             update: payload of the received sync update message from `client`.
             client: connection from which the sync update message came.
+            message: the received message if it is a sync update message already.
         """
         if update != b"\x00\x00":
             self.ydoc.apply_update(update)
 
-            # reencode sync update message and selectively broadcast
+            # reencode sync update message if necessary and selectively broadcast
             # to all other clients
-            message, _ = YMessage.SYNC_UPDATE.encode(update)
+            if message is None:
+                message, _ = YMessage.SYNC_UPDATE.encode(update)
+
             self.broadcast(message, client)
 
-    async def process_awareness(self, state: bytes, client: ServerConnection):
+    async def process_awareness(
+        self,
+        state: bytes,
+        client: ServerConnection,
+        message: None | bytes = None,
+    ):
         """
         Process an awareness message payload `state` from `client`.
+
+        Arguments:
+            state: payload of the received awareness message from `client`.
+            client: connection from which the awareness message came.
+            message: the received awareness message, encoded from `state` if not given.
         """
-        message, _ = YMessage.AWARENESS.encode(state)
+        if message is None:
+            message, _ = YMessage.AWARENESS.encode(state)
+
         self.broadcast(message, client)
 
 
@@ -382,9 +420,24 @@ class WebsocketServer(Component):
     rooms: dict[str, Room]
     """mapping of connection handlers to their corresponding identifiers."""
 
+    room_starts: dict[str, anyio.Event]
+    """mapping of identifiers to events set once their room has started."""
+
     tls: SSLContext | None
     """[`SSLContext`][`ssl.SSLContext`] instance for TLS connections."""
 
+    max_connections: None | int
+    """maximum number of connections handled at once, unlimited if `None`."""
+
+    max_room_connections: None | int
+    """maximum number of connections per room handled at once, unlimited if `None`."""
+
+    connections: int
+    """number of currently admitted connections."""
+
+    room_connections: dict[str, int]
+    """mapping of room identifiers to their number of currently admitted connections."""
+
     def __init__(
         self,
         host: str,
@@ -393,6 +446,8 @@ class WebsocketServer(Component):
         path: None | Path = None,
         process_request: None | Callable = None,
         tls_config: dict = {},
+        max_connections: None | int = None,
+        max_room_connections: None | int = None,
     ):
         """
         Arguments:
@@ -402,11 +457,17 @@ class WebsocketServer(Component):
             path: path where to store Y Document contents on disk.
             process_request: callable checking the HTTP request headers on new connections.
             tls: [`SSLContext`][`ssl.SSLContext`] instance for TLS connections.
+            max_connections: maximum number of connections handled at once, unlimited if `None`.
+            max_room_connections: maximum number of connections per room handled at once, unlimited if `None`.
         """
         self.host = host
         self.port = port
         self.persistent = persistent
         self.path = path
+        self.max_connections = max_connections
+        self.max_room_connections = max_room_connections
+        self.connections = 0
+        self.room_connections = dict()
         self.tls = server(host, tls_config)
 
         if path is not None:
@@ -425,14 +486,16 @@ class WebsocketServer(Component):
             except PermissionError:
                 raise PermissionError(f"'{path}' is not writable") from None
 
-        if process_request is None:
-            self.process_request = self.check_path
-        else:
-            self.process_request = RequestProcessor(
-                self.check_path, process_request
-            ).process_request
+        # admit connections only after all other checks passed
+        funcs = [self.check_path]
+        if process_request is not None:
+            funcs.append(process_request)
+        funcs.append(self.check_capacity)
+
+        self.process_request = RequestProcessor(*funcs).process_request
 
         self.rooms = dict()
+        self.room_starts = dict()
 
     @property
     def states(self) -> WebsocketServerState:
@@ -454,6 +517,9 @@ class WebsocketServer(Component):
             process_request=self.process_request,
             logger=conn_logger,
             ssl=self.tls,
+            # `broadcast` would compress every frame once per recipient otherwise;
+            # Y updates are compact binary data and gain little from deflate
+            compression=None,
         ):
             self._change_state(self.states.NONE, self.states.SERVING)
 
@@ -525,6 +591,68 @@ class WebsocketServer(Component):
                 reason_phrase=reason,
             )
 
+    def check_capacity(
+        self, websocket: ServerConnection, request: Request
+    ) -> None | Response:
+        """
+        Check if the server and the requested room accept another connection.
+
+        This function is a request processing callable and automatically passed to the inner [`serve`][websockets.asyncio.server.serve] function.
+
+        On success, the connection is counted right away, i.e. while still in the handshake,
+        so that concurrent handshakes can't exceed the limits.
+        It is released again as soon as the connection is closed, whether the handshake failed or not.
+
+        Arguments:
+            websocket: connection object.
+            request: HTTP request header object.
+
+        Returns:
+            `None` if the connection can be handled, else a [`Response`][websockets.http11.Response] with HTTP status 503 (service unavailable).
+        """
+        identifier = request.path[1:]
+
+        if self.max_connections is not None:
+            if self.connections >= self.max_connections:
+                return Response(
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                    headers=Headers(),
+                    reason_phrase="Server is at its connection limit",
+                )
+
+        if self.max_room_connections is not None:
+            room_connections = self.room_connections.get(identifier, 0)
+            if room_connections >= self.max_room_connections:
+                return Response(
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                    headers=Headers(),
+                    reason_phrase="Room is at its connection limit",
+                )
+
+        # reserve the slots until the connection is closed
+        self.connections += 1
+        self.room_connections[identifier] = self.room_connections.get(identifier, 0) + 1
+        self._task_group.start_soon(self.release, websocket, identifier)
+
+    async def release(self, websocket: ServerConnection, identifier: str):
+        """
+        Release the slots of an admitted connection once it is closed.
+
+        Arguments:
+            websocket: the admitted connection.
+            identifier: the identifier of the requested room.
+        """
+        try:
+            await websocket.wait_closed()
+        finally:
+            self.connections -= 1
+
+            room_connections = self.room_connections[identifier] - 1
+            if room_connections:
+                self.room_connections[identifier] = room_connections
+            else:
+                del self.room_connections[identifier]
+
     async def get_room(self, identifier: str) -> Room:
         """
         Get or create a [`Room`][elva.server.Room] via its corresponding `identifier`.
@@ -546,9 +674,17 @@ class WebsocketServer(Component):
             )
             self.rooms[identifier] = room
 
-        # make sure the room is `ACTIVE`
-        if room.states.ACTIVE not in room.state:
-            await self._task_group.start(room.start)
+        # make sure the room is `ACTIVE`, but start it only once
+        # when several clients connect to it at the same time
+        if (started := self.room_starts.get(identifier)) is not None:
+            await started.wait()
+        elif room.states.ACTIVE not in room.state:
+            self.room_starts[identifier] = started = anyio.Event()
+            try:
+                await self._task_group.start(room.start)
+            finally:
+                del self.room_starts[identifier]
+                started.set()
 
         return room
 
@@ -121,7 +121,7 @@ class SQLiteStore(Data, Component):
         self._execute("INSERT INTO yupdates VALUES (?)", [update])
         self._commit()
 
-        self.log.debug(f"wrote update to file {self.path}")
+        self.log.debug("wrote update to file %s", self.path)
 
     def _merge(self) -> None:
         """
@@ -186,7 +186,7 @@ class SQLiteStore(Data, Component):
         self.log.debug("listening for updates")
 
         async for update in self._receive:
-            self.log.debug(f"received update {update}")
+            self.log.debug("received update %s", update)
 
             with CancelScope(shield=True):
                 # writing needs to be shielded from cancellation,
@@ -2,6 +2,9 @@
 [`Textual`](https://textual.textualize.io/) screens for ELVA apps.
 """
 
+from itertools import chain
+
+from anyio import sleep
 from textual.message import Message
 from textual.screen import ModalScreen, Screen
 from textual.widgets import Input, Static
@@ -9,6 +12,9 @@ from textual.widgets import Input, Static
 from elva.widgets.awareness import AwarenessView
 from elva.widgets.config import ConfigView
 
+AWARENESS_REFRESH_DELAY = 0.05
+"""Time in seconds in which awareness changes are coalesced into one dashboard refresh."""
+
 
 class Dashboard(Screen):
     """
@@ -36,6 +42,63 @@ class Dashboard(Screen):
         self.dismiss()
 
 
+class DashboardRefresh:
+    """
+    Mixin for apps refreshing the client states on their [`Dashboard`][elva.widgets.screens.Dashboard].
+
+    The app is expected to have a `dashboard` screen and a `provider` attribute,
+    which is either `None` or a [`WebsocketProvider`][elva.provider.WebsocketProvider].
+    """
+
+    _awareness_refresh_pending: bool = False
+    """Flag whether a dashboard refresh is already scheduled."""
+
+    async def refresh_client_states(self):
+        """
+        Push the client states to the dashboard if it is shown.
+
+        Calls arriving while a refresh is already pending are coalesced into it.
+        """
+        if self._awareness_refresh_pending:
+            return
+
+        self._awareness_refresh_pending = True
+
+        try:
+            # wait for further changes to be included in this refresh
+            await sleep(AWARENESS_REFRESH_DELAY)
+
+            if self.screen == self.get_screen("dashboard"):
+                self.push_client_states()
+        finally:
+            self._awareness_refresh_pending = False
+
+    def push_client_states(self):
+        """
+        Method pushing the client states to the active dashboard.
+        """
+        if self.provider is not None:
+            client_states = self.provider.awareness.client_states
+            client_id = self.provider.awareness.client_id
+            if client_id not in client_states:
+                return
+
+            # put the local state first, collecting references without copying
+            states = tuple(
+                chain(
+                    ((client_id, client_states[client_id]),),
+                    (
+                        (other_id, state)
+                        for other_id, state in client_states.items()
+                        if other_id != client_id
+                    ),
+                )
+            )
+
+            awareness_view = self.screen.query_one(AwarenessView)
+            awareness_view.states = states
+
+
 class InputScreen(ModalScreen):
     """
     A plain modal screen with a single input field.
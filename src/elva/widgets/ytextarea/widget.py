@@ -2,15 +2,17 @@
 Widget definition.
 """
 
+from bisect import bisect_right
 from collections import deque
 from typing import Literal, Self
 
 from pycrdt import ReadTransaction, Text, UndoManager
 from rich.segment import Segment
 from rich.style import Style
+from textual.geometry import Region
 from textual.strip import Strip
 from textual.widgets import TextArea
-from textual.widgets.text_area import EditResult, Location
+from textual.widgets.text_area import Edit, EditResult, Location
 
 from elva.awareness import Awareness
 from elva.parser import TextEventParser
@@ -80,11 +82,17 @@ class YTextArea(TextArea, TextEventParser):
 
         # initialize remote cursor tracking
         self._remote_cursor_caches = dict()
+        self._remote_cursor_offsets = None
         self.cursor_cache_size = cursor_cache_size
 
         # default color for remote cursors
         self.default_cursor_color = "#808080"
 
+        # line start tables, built lazily and patched after every edit
+        self._line_starts = None
+        self._line_starts_document = None
+        self._line_starts_edit = None
+
     @classmethod
     def code_editor(cls, ytext: Text, *args: tuple, **kwargs: dict) -> Self:
         """
@@ -110,7 +118,9 @@ class YTextArea(TextArea, TextEventParser):
         Returns:
             index in the UTF-8 decoded form of `btext`.
         """
-        return len(self.document.text.encode()[:index].decode())
+        row, column = self.get_location_from_binary_index(index)
+        starts, _ = self._get_line_starts()
+        return starts[row] + column
 
     def get_binary_index_from_index(self, index: int) -> int:
         """
@@ -122,7 +132,124 @@ class YTextArea(TextArea, TextEventParser):
         Returns:
             index in the UTF-8 encoded form of `text`.
         """
-        return len(self.document.text[:index].encode())
+        starts, _ = self._get_line_starts()
+        row = bisect_right(starts, index) - 1
+        return self.get_binary_index_from_location((row, index - starts[row]))
+
+    def _get_line_starts(self) -> tuple[list[int], list[int]]:
+        """
+        Get the character and UTF-8 byte indices at which the lines of the document start.
+
+        The tables are cached until the next edit or until the document is replaced,
+        so that index and location conversions neither need to walk all lines
+        nor to encode the whole text.
+        After an edit, only the lines touched by it are measured again.
+
+        Returns:
+            the ascending character and UTF-8 byte start indices of all lines in the document.
+        """
+        document = self.document
+
+        if self._line_starts is None or self._line_starts_document is not document:
+            pending = self._line_starts_edit
+            self._line_starts_edit = None
+
+            # the edit result is only present once the edit has been applied
+            if pending is not None and pending[0] is document:
+                _, tables, edit = pending
+                result = getattr(edit, "_edit_result", None)
+            else:
+                result = None
+
+            if result is not None:
+                tables = self._patch_line_starts(
+                    *tables, edit.top[0], edit.bottom[0], result.end_location[0]
+                )
+            else:
+                tables = self._measure_line_starts([0], [0], 0)
+
+            self._line_starts = tables
+            self._line_starts_document = document
+
+        return self._line_starts
+
+    def _measure_line_starts(
+        self,
+        starts: list[int],
+        bstarts: list[int],
+        first: int,
+        last: int | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Append the start indices of the lines following the given range of lines.
+
+        Arguments:
+            starts: character start indices up to and including line `first`.
+            bstarts: UTF-8 byte start indices up to and including line `first`.
+            first: the first line to measure.
+            last: the last line to measure, defaults to all remaining lines.
+
+        Returns:
+            the extended character and UTF-8 byte start indices.
+        """
+        lines = self.document.lines
+
+        # newline characters are ASCII, i.e. one byte per character
+        nnewline = len(self.document.newline)
+
+        # the last line is not followed by a newline
+        stop = len(lines) - 1
+        if last is not None:
+            stop = min(last + 1, stop)
+
+        start = starts[-1]
+        bstart = bstarts[-1]
+
+        for row in range(first, stop):
+            line = lines[row]
+            start += len(line) + nnewline
+            bstart += len(line.encode()) + nnewline
+            starts.append(start)
+            bstarts.append(bstart)
+
+        return starts, bstarts
+
+    def _patch_line_starts(
+        self,
+        starts: list[int],
+        bstarts: list[int],
+        top: int,
+        bottom: int,
+        end: int,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Update the line start tables of the document before an edit.
+
+        Arguments:
+            starts: character start indices of all lines before the edit.
+            bstarts: UTF-8 byte start indices of all lines before the edit.
+            top: the first line of the replaced range.
+            bottom: the last line of the replaced range.
+            end: the last line of the inserted text after the edit.
+
+        Returns:
+            the character and UTF-8 byte start indices of all lines after the edit.
+        """
+        # lines up to `top` start at the same indices as before,
+        # the edited lines are measured again
+        new_starts, new_bstarts = self._measure_line_starts(
+            starts[: top + 1], bstarts[: top + 1], top, end
+        )
+
+        # the lines behind the edit are moved as a whole
+        if bottom + 1 < len(starts):
+            shift = new_starts[-1] - starts[bottom + 1]
+            bshift = new_bstarts[-1] - bstarts[bottom + 1]
+
+            new_starts.extend(start + shift for start in starts[bottom + 2 :])
+            new_bstarts.extend(bstart + bshift for bstart in bstarts[bottom + 2 :])
+
+        return new_starts, new_bstarts
 
     def get_location_from_binary_index(self, index: int) -> tuple:
         """
@@ -134,8 +261,26 @@ class YTextArea(TextArea, TextEventParser):
         Returns:
             a location with containing row and column coordinates.
         """
-        index = self.get_index_from_binary_index(index)
-        return self.document.get_location_from_index(index)
+        _, bstarts = self._get_line_starts()
+
+        # find the line containing `index`
+        row = bisect_right(bstarts, index) - 1
+
+        # encode only the found line
+        line = self.document.lines[row]
+        bline = line.encode()
+        offset = index - bstarts[row]
+
+        if offset <= len(bline):
+            column = len(bline[:offset].decode())
+        elif row < len(bstarts) - 1:
+            # the index lies within the newline characters
+            column = len(line) + offset - len(bline)
+        else:
+            # the index lies beyond the end of the text
+            column = len(line)
+
+        return row, column
 
     def get_binary_index_from_location(self, location: tuple) -> int:
         """
@@ -147,8 +292,49 @@ class YTextArea(TextArea, TextEventParser):
         Returns:
             the index in the UTF-8 encoded text.
         """
-        index = self.document.get_index_from_location(location)
-        return self.get_binary_index_from_index(index)
+        row, column = location
+        _, bstarts = self._get_line_starts()
+
+        # encode only the part of the line before `column`
+        line = self.document.lines[row]
+        nline = len(line)
+
+        if column <= nline:
+            offset = len(line[:column].encode())
+        elif row < len(bstarts) - 1:
+            # the location lies within the newline characters
+            offset = len(line.encode()) + column - nline
+        else:
+            # the location lies beyond the end of the text
+            offset = len(line.encode())
+
+        return bstarts[row] + offset
+
+    def edit(self, edit: Edit) -> EditResult:
+        """
+        Perform an edit and invalidate the cached line start tables.
+
+        The tables are patched on next access instead of being measured again,
+        which might already happen within the edit, e.g. on updating the cursor.
+
+        Arguments:
+            edit: the edit to perform.
+
+        Returns:
+            the result of the performed edit.
+        """
+        if self._line_starts is not None:
+            self._line_starts_edit = (
+                self._line_starts_document,
+                self._line_starts,
+                edit,
+            )
+        else:
+            # the tables have not been measured since the last edit
+            self._line_starts_edit = None
+
+        self._line_starts = None
+        return super().edit(edit)
 
     def _on_edit(
         self,
@@ -172,10 +358,15 @@ class YTextArea(TextArea, TextEventParser):
 
         # convert from binary index to document locations
         start = self.get_location_from_binary_index(retain)
-        end = self.get_location_from_binary_index(retain + delete)
+        if delete:
+            end = self.get_location_from_binary_index(retain + delete)
+        else:
+            # pure insertions have an empty deletion range
+            end = start
 
-        # perform the edit and update the app state
-        self.replace(insert, start, end, origin="remote")
+        # perform the edit and update the app state,
+        # reusing the binary indices we already have
+        self._replace(insert, start, end, retain, retain + delete, origin="remote")
 
     def on_mount(self):
         """
@@ -224,11 +415,45 @@ class YTextArea(TextArea, TextEventParser):
         Returns:
             the result of the performed edit.
         """
-        _start, _end = sorted((start, end))
+        # order the locations without building and sorting a list
+        _start, _end = (start, end) if start <= end else (end, start)
 
         istart = self.get_binary_index_from_location(_start)
         iend = self.get_binary_index_from_location(_end)
 
+        return self._replace(
+            insert,
+            start,
+            end,
+            istart,
+            iend,
+            maintain_selection_offset=maintain_selection_offset,
+            origin=origin,
+        )
+
+    def _replace(
+        self,
+        insert: str,
+        start: tuple,
+        end: tuple,
+        istart: int,
+        iend: int,
+        maintain_selection_offset: bool = True,
+        origin: str = "local",
+    ) -> EditResult:
+        """
+        Replace part of the text with the binary indices of the deletion range known.
+
+        Arguments:
+            insert: the characters to insert.
+            start: the start location of the deletion range.
+            end: the end location of the deletion range.
+            istart: the binary index of the ordered start of the deletion range.
+            iend: the binary index of the ordered end of the deletion range.
+
+        Returns:
+            the result of the performed edit.
+        """
         # don't redo remote updates twice in the ytext
         if origin == "local":
             doc = self.ytext.doc
@@ -469,6 +694,55 @@ class YTextArea(TextArea, TextEventParser):
         if hasattr(self, "awareness") and self.awareness is not None:
             self._set_cursor_state()
 
+    def _get_remote_cursor_offsets(self) -> dict[int, list[tuple[int, str]]]:
+        """
+        Locate the remote cursors on screen.
+
+        Returns:
+            a mapping of screen rows to the screen columns and colors of the remote cursors on them.
+        """
+        offsets = dict()
+
+        # Account for gutter width and scroll
+        gutter_width = self.gutter_width
+        scroll_x = self.scroll_offset.x
+
+        for client, cache in self._remote_cursor_caches.items():
+            color = self._get_cursor_color(client)
+
+            ianchor, ihead = cache[-1]
+            anchor = self.get_location_from_binary_index(ianchor)
+
+            # cap the maximum location, just to be sure
+            anchor = min(anchor, self.document.end)
+
+            # Convert document location to screen offset (handles wrapping)
+            screen_offset = self.wrapped_document.location_to_offset(anchor)
+            screen_col = screen_offset.x + gutter_width - scroll_x
+
+            offsets.setdefault(screen_offset.y, []).append((screen_col, color))
+
+        return offsets
+
+    def render_lines(self, crop: Region) -> list[Strip]:
+        """
+        Render lines with remote cursors located once for all of them.
+
+        Arguments:
+            crop: the region within the visible area to render.
+
+        Returns:
+            the rendered strips.
+        """
+        if self.awareness is None or not self._remote_cursor_caches:
+            return super().render_lines(crop)
+
+        self._remote_cursor_offsets = self._get_remote_cursor_offsets()
+        try:
+            return super().render_lines(crop)
+        finally:
+            self._remote_cursor_offsets = None
+
     def render_line(self, y: int) -> Strip:
         """
         Render a line with remote cursor indicators.
@@ -481,41 +755,23 @@ class YTextArea(TextArea, TextEventParser):
         """
         strip = super().render_line(y)
 
-        if self.awareness is None:
+        if self.awareness is None or not self._remote_cursor_caches:
             return strip
 
-        caches = self._remote_cursor_caches
-
-        if not caches:
-            return strip
+        # located once per render pass, if available
+        offsets = self._remote_cursor_offsets
+        if offsets is None:
+            offsets = self._get_remote_cursor_offsets()
 
         # Screen row accounting for scroll
         screen_row = y + self.scroll_offset.y
 
         # Collect cursor positions on this line
-        cursor_positions = []
-
-        for client, cache in caches.items():
-            color = self._get_cursor_color(client)
-
-            ianchor, ihead = cache[-1]
-            anchor = self.get_location_from_binary_index(ianchor)
-
-            # cap the maximum location, just to be sure
-            anchor = min(anchor, self.document.end)
-
-            # Convert document location to screen offset (handles wrapping)
-            screen_offset = self.wrapped_document.location_to_offset(anchor)
-
-            # run calculations only for the screen row containing the cursor
-            if screen_offset.y == screen_row:
-                # Account for gutter width and scroll
-                gutter_width = self.gutter_width
-                scroll_x = self.scroll_offset.x
-                screen_col = screen_offset.x + gutter_width - scroll_x
-
-                if 0 <= screen_col < strip.cell_length:
-                    cursor_positions.append((screen_col, color))
+        cursor_positions = [
+            (screen_col, color)
+            for screen_col, color in offsets.get(screen_row, ())
+            if 0 <= screen_col < strip.cell_length
+        ]
 
         # Apply cursor highlights by dividing and rejoining the strip
         for screen_col, color in cursor_positions:
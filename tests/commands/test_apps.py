@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import anyio
+import pytest
+
+from elva.commands.chat.app import UI as ChatUI
+from elva.commands.editor.app import UI as EditorUI
+from elva.commands.editor.app import get_language_suffix
+from elva.config import Config
+
+## ANYIO PYTEST PLUGIN
+pytestmark = pytest.mark.anyio
+
+
+# `textual` runs only on `asyncio`
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.parametrize("UI", (EditorUI, ChatUI))
+async def test_awareness_updates_coalesced(UI):
+    """A burst of awareness changes results in a single dashboard refresh."""
+    ui = UI(Config())
+
+    async with ui.run_test():
+        await ui.action_toggle_dashboard()
+
+        refreshes = 0
+
+        def push_client_states():
+            nonlocal refreshes
+            refreshes += 1
+
+        ui.push_client_states = push_client_states
+
+        data = (dict(added=[], updated=[], removed=[]), "remote")
+        async with anyio.create_task_group() as tg:
+            for _ in range(10):
+                tg.start_soon(ui._on_awareness_update, "change", data)
+
+        assert refreshes == 1
+
+        # later changes are refreshed again
+        await ui._on_awareness_update("change", data)
+        assert refreshes == 2
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    (
+        ("x.py.y", "py"),
+        ("x.yml.y", "yml"),
+        ("x.yaml.y", "yaml"),
+        ("dir/x.md.y", "md"),
+        # only the last suffix before the data file suffix counts
+        ("a.b.py.y", "py"),
+        # no suffix before the data file suffix
+        ("x.y", ""),
+        # a leading dot denotes a hidden file
+        (".py.y", ""),
+        # not a data file
+        ("x.py", ""),
+        ("x.py.txt", ""),
+    ),
+)
+def test_get_language_suffix(path, expected):
+    """Get the suffix in front of the data file suffix."""
+    assert get_language_suffix(Path(path)) == expected
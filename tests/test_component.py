@@ -9,7 +9,12 @@ from enum import Flag
 import anyio
 import pytest
 
-from elva.component import Component, ComponentState, create_component_state
+from elva.component import (
+    Component,
+    ComponentState,
+    create_component_state,
+    start_components,
+)
 from elva.log import LOGGER_NAME, DefaultFormatter
 
 pytestmark = pytest.mark.anyio
@@ -77,6 +82,23 @@ class QueueLogger(Component):
         self.queue.put("cleanup")
 
 
+class FailingLogger(Component):
+    """Component failing to start after the others are running."""
+
+    def __init__(self, others):
+        self.others = others
+
+    async def before(self):
+        # fail halfway through the startup of all components
+        for other in self.others:
+            sub = other.subscribe()
+            while other.states.RUNNING not in other.state:
+                await sub.receive()
+            other.unsubscribe(sub)
+
+        raise ValueError("failed to start")
+
+
 class InterruptedLogger(Component):
     """Component logging to a queue."""
 
@@ -307,6 +329,30 @@ async def test_cleanup_shut_down_subscription():
     assert sub not in comp._subscribers
 
 
+async def test_lagging_subscription_drops_oldest():
+    """A subscriber falling behind keeps its subscription and the newest diffs."""
+    comp = Component()
+    sub = comp.subscribe()
+
+    NUM_CHANGES = sub.statistics().max_buffer_size + 1
+    for i in range(NUM_CHANGES):
+        if i % 2:
+            comp._change_state(ComponentState.ACTIVE, ComponentState.NONE)
+        else:
+            comp._change_state(ComponentState.NONE, ComponentState.ACTIVE)
+
+    # the subscriber is still registered with a full buffer
+    assert sub in comp._subscribers
+    stats = sub.statistics()
+    assert stats.current_buffer_used == stats.max_buffer_size
+
+    # the oldest diff has been dropped
+    diff = await sub.receive()
+    assert diff == (ComponentState.ACTIVE, ComponentState.NONE)
+
+    comp.unsubscribe(sub)
+
+
 async def test_custom_component_state():
     """States for custom components can easily defined and state changes work in patches."""
     # check if state enum creation succeeds
@@ -467,6 +513,21 @@ async def test_handled_component_already_running_method():
     assert "already active" in repr(excinfo.value)
 
 
+async def test_component_concurrent_start():
+    """A component started concurrently runs only once."""
+    comp = Logger()
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(comp.start)
+            tg.start_soon(comp.start)
+
+    # the second start failed and cancelled the first one
+    assert excinfo.group_contains(RuntimeError, match="already active")
+    assert comp.buffer == ["before", "run", "cleanup"]
+    assert comp.state == comp.states.NONE
+
+
 async def test_handled_component_not_running_method():
     """A component includes a runtime error message when stopped twice via its stop method."""
     with pytest.raises(RuntimeError) as excinfo:
@@ -582,6 +643,41 @@ async def test_start_stop_methods_concurrent():
     assert buffer == events
 
 
+async def test_start_components():
+    """Components start concurrently and stop together."""
+    comps = [Logger() for _ in range(3)]
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(start_components, comps)
+
+        for comp in comps:
+            sub = comp.subscribe()
+            while comp.states.RUNNING not in comp.state:
+                await sub.receive()
+            comp.unsubscribe(sub)
+
+        tg.cancel_scope.cancel()
+
+    for comp in comps:
+        assert comp.state == comp.states.NONE
+        assert comp.buffer == ["before", "run", "cleanup"]
+
+
+async def test_start_components_failing():
+    """Components are cleaned up when another one fails to start."""
+    comps = [Logger() for _ in range(3)]
+    failing = FailingLogger(comps)
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await start_components([*comps, failing])
+
+    assert exc_info.group_contains(ValueError, match="failed to start")
+
+    for comp in comps:
+        assert comp.state == comp.states.NONE
+        assert comp.buffer == ["before", "run", "cleanup"]
+
+
 async def test_start_stop_nested_concurrent_mixed():
     """Components start and stop concurrently in nested contexts."""
 
@@ -0,0 +1,62 @@
+import logging
+from queue import Queue
+
+from elva.log import DefaultFormatter, QueueHandler, handle_in_background
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = list()
+        self.closed = False
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def test_handle_in_background():
+    """Log records are handled in the background and flushed on exit."""
+    handler = ListHandler()
+    handler.setFormatter(DefaultFormatter())
+
+    log = logging.getLogger("test_handle_in_background")
+    log.setLevel(logging.DEBUG)
+
+    with handle_in_background(log, handler) as queue_handler:
+        assert queue_handler in log.handlers
+
+        for i in range(100):
+            log.debug("message %s", i)
+
+    # the queue handler is removed together with the listener
+    assert queue_handler not in log.handlers
+
+    assert len(handler.messages) == 100
+    assert handler.messages[0].endswith("[test_handle_in_background] message 0")
+    assert handler.messages[-1].endswith("message 99")
+    assert handler.closed
+
+
+def test_queue_handler_drops_oldest(monkeypatch):
+    """A full queue drops the oldest records instead of blocking or failing."""
+    queue = Queue(2)
+    handler = QueueHandler(queue)
+
+    log = logging.getLogger("test_queue_handler_drops_oldest")
+    monkeypatch.setattr(log, "propagate", False)
+    log.addHandler(handler)
+
+    for i in range(5):
+        log.warning("message %s", i)
+
+    log.removeHandler(handler)
+
+    assert [queue.get_nowait().getMessage() for _ in range(2)] == [
+        "message 3",
+        "message 4",
+    ]
+    assert queue.empty()
@@ -4,6 +4,7 @@ import pytest
 
 from elva.protocol import (
     ElvaMessage,
+    YCodec,
     YMessage,
     prepend_var_uint,
     read_var_uint,
@@ -144,6 +145,38 @@ def test_y_protocol(protocol, message_type, payload_in, message_out):
     assert length == len(msg)
 
 
+@pytest.mark.parametrize(
+    "protocol",
+    ("y", "elva"),
+)
+@pytest.mark.parametrize(
+    ("size", "length_prefix"),
+    (
+        (127, b"\x7f"),
+        (128, b"\x80\x01"),
+        (300, b"\xac\x02"),
+        (16384, b"\x80\x80\x01"),
+    ),
+)
+def test_encode_large_payload(protocol, size, length_prefix):
+    """Encode payloads with multi-byte length prefixes like the base codec."""
+    Message = get_protocol_class(protocol)
+    payload = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+
+    for MessageType in Message:
+        msg, length = MessageType.encode(payload)
+        assert msg == MessageType.magic_bytes + length_prefix + payload
+        assert length == size
+
+        # same bytes as encoding with the base codec and prepending the magic bytes
+        base, _ = YCodec().encode(payload)
+        assert msg == MessageType.magic_bytes + base
+
+        payload_out, length = MessageType.decode(msg)
+        assert payload_out == payload
+        assert length == len(msg)
+
+
 def test_message_types():
     """List all defined message types."""
     assert set(YMessage.get_types()) == set(
@@ -187,6 +220,7 @@ def test_infer_and_decode(message_type):
 
     assert msg_type == MessageType
     assert payload_out == MSG
+    assert type(payload_out) is bytes
 
 
 @pytest.mark.parametrize(
@@ -38,6 +38,21 @@ async def test_render_without_start(tmp_path):
         await renderer.write()
 
 
+@pytest.mark.parametrize(
+    ("config", "auto_save", "timeout"),
+    (
+        ({}, True, 300),
+        ({"render.auto": False, "render.timeout": 10}, False, 10),
+    ),
+)
+def test_renderer_from_config(tmp_path, config, auto_save, timeout):
+    """The renderer takes its options from the configuration."""
+    renderer = TextRenderer.from_config(Text(), tmp_path / "test.txt", config)
+
+    assert renderer._auto_save is auto_save
+    assert renderer.timeout == timeout
+
+
 async def test_render_ytext(tmp_path):
     """The YText data type is rendered properly."""
 
@@ -104,6 +119,43 @@ async def test_render_ytext(tmp_path):
         assert file.read() == content1 + content2 + content3
 
 
+async def test_reverted_change_is_saved(tmp_path):
+    """Reverting a change restores the `SAVED` state without writing again."""
+
+    # setup path and content
+    path = tmp_path / "test.txt"
+
+    content = "some content"
+    ytext = Text(content)
+
+    # integrate the YText in a YDoc
+    ydoc = Doc()
+    ydoc["text"] = ytext
+
+    # instantiate the renderer component
+    renderer = TextRenderer(ytext, path)
+
+    async with renderer:
+        sub = renderer.subscribe()
+
+        # wait for the initial write
+        while renderer.states.SAVED not in renderer.state:
+            await sub.receive()
+
+        # change the content
+        ytext += " and more"
+        assert renderer.states.SAVED not in renderer.state
+
+        # revert the change
+        del ytext[len(content) :]
+
+        # the content equals the written one again
+        assert renderer.states.SAVED in renderer.state
+
+        # unsubscribe for good measure
+        renderer.unsubscribe(sub)
+
+
 async def test_render_xml(tmp_path):
     """The XML data types are rendered properly."""
     # setup path and content
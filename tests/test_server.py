@@ -1,4 +1,6 @@
+import asyncio
 import sqlite3
+import sys
 import uuid
 from http import HTTPStatus
 
@@ -20,10 +22,30 @@ from elva.server import RequestProcessor, WebsocketServer, free_tcp_port
 pytestmark = pytest.mark.anyio
 
 
+def eager_event_loop():
+    # mirror the task factory set by the `elva server` app
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 # `websockets` runs only on `asyncio`, thus the `trio` backend of `anyio` fails
-@pytest.fixture(scope="module")
-def anyio_backend():
-    return "asyncio"
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param("asyncio", id="asyncio"),
+        pytest.param(
+            ("asyncio", {"loop_factory": eager_event_loop}),
+            id="asyncio-eager",
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 12),
+                reason="eager task factory requires Python 3.12",
+            ),
+        ),
+    ],
+)
+def anyio_backend(request):
+    return request.param
 
 
 def test_free_tcp_port():
@@ -132,6 +154,128 @@ async def test_websocket_server_request_processor(free_tcp_port):
         assert identifier in websocket_server.rooms
 
 
+async def test_websocket_server_connection_limits(free_tcp_port):
+    async with WebsocketServer(
+        host=LOCALHOST,
+        port=free_tcp_port,
+        max_connections=2,
+        max_room_connections=1,
+    ) as websocket_server:
+        host, port = websocket_server.host, websocket_server.port
+
+        async with await connect_websocket_client(
+            websocket_client_uri(host, port, "first-room")
+        ):
+            # wait for the server to handle the connection
+            while websocket_server.connections < 1:
+                await anyio.sleep(0.01)
+
+            # the room is full, so we expect a HTTP status 503 (service unavailable) response
+            with pytest.raises(InvalidStatus) as exc_info:
+                await connect_websocket_client(
+                    websocket_client_uri(host, port, "first-room")
+                )
+            assert exc_info.value.response.status_code == 503
+
+            async with await connect_websocket_client(
+                websocket_client_uri(host, port, "second-room")
+            ):
+                while websocket_server.connections < 2:
+                    await anyio.sleep(0.01)
+
+                # the server is full
+                with pytest.raises(InvalidStatus) as exc_info:
+                    await connect_websocket_client(
+                        websocket_client_uri(host, port, "third-room")
+                    )
+                assert exc_info.value.response.status_code == 503
+
+        # connections are released again
+        while websocket_server.connections > 0:
+            await anyio.sleep(0.01)
+
+        await connect_websocket_client(websocket_client_uri(host, port, "third-room"))
+        assert "third-room" in websocket_server.rooms
+
+
+async def test_websocket_server_concurrent_room_start(free_tcp_port):
+    identifier = "concurrent-room"
+
+    async with WebsocketServer(
+        LOCALHOST, free_tcp_port, persistent=True
+    ) as websocket_server:
+        uri = websocket_client_uri(
+            websocket_server.host, websocket_server.port, identifier
+        )
+
+        clients = list()
+
+        async def connect_to_room():
+            clients.append(await connect_websocket_client(uri))
+
+        # the first connections to a new room arrive at the same time
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(connect_to_room)
+
+        # the room has been started once and handles all connections
+        with anyio.fail_after(5):
+            while len(websocket_server.rooms[identifier].clients) < 5:
+                await anyio.sleep(0.01)
+
+        for client in clients:
+            assert client.close_code is None
+            await client.close()
+
+
+async def test_websocket_server_concurrent_connection_limits(free_tcp_port):
+    async with WebsocketServer(
+        host=LOCALHOST,
+        port=free_tcp_port,
+        max_connections=4,
+        max_room_connections=2,
+    ) as websocket_server:
+        host, port = websocket_server.host, websocket_server.port
+
+        accepted = dict()
+        rejected = dict()
+        done = anyio.Event()
+
+        async def connect_to(identifier):
+            uri = websocket_client_uri(host, port, identifier)
+            try:
+                async with await connect_websocket_client(uri):
+                    accepted[identifier] = accepted.get(identifier, 0) + 1
+
+                    # keep the connection open until all attempts are made
+                    await done.wait()
+            except InvalidStatus as exc:
+                assert exc.response.status_code == 503
+                rejected[identifier] = rejected.get(identifier, 0) + 1
+
+        async with anyio.create_task_group() as tg:
+            # handshakes run concurrently
+            for identifier in ("first-room", "second-room", "third-room"):
+                for _ in range(5):
+                    tg.start_soon(connect_to, identifier)
+
+            while sum(accepted.values()) + sum(rejected.values()) < 15:
+                await anyio.sleep(0.01)
+
+            # neither the server limit nor any room limit are exceeded
+            assert sum(accepted.values()) == 4
+            assert all(n <= 2 for n in accepted.values())
+            assert websocket_server.connections == 4
+
+            done.set()
+
+        # all slots are released again
+        while websocket_server.connections > 0:
+            await anyio.sleep(0.01)
+
+        assert websocket_server.room_connections == {}
+
+
 async def test_websocket_server_restart(free_tcp_port):
     server = WebsocketServer(LOCALHOST, free_tcp_port, persistent=True)
 
@@ -93,3 +93,56 @@ def test_widget_byte_char_roundtrip(text, byte_index):
     char_index = w.get_index_from_binary_index(byte_index)
     result = w.get_binary_index_from_index(char_index)
     assert result == byte_index
+
+
+@pytest.mark.parametrize(
+    ("text", "byte_index", "expected_location"),
+    (
+        ("", 0, (0, 0)),
+        ("ab\ncd", 0, (0, 0)),
+        ("ab\ncd", 2, (0, 2)),  # before newline
+        ("ab\ncd", 3, (1, 0)),  # after newline
+        ("ab\ncd", 5, (1, 2)),  # end of text
+        ("a\N{PALM TREE}\ncafé\n", 5, (0, 2)),  # after emoji
+        ("a\N{PALM TREE}\ncafé\n", 6, (1, 0)),
+        ("a\N{PALM TREE}\ncafé\n", 11, (1, 4)),  # after 'é'
+        ("a\N{PALM TREE}\ncafé\n", 12, (2, 0)),  # trailing empty line
+        ("ab\r\ncd", 4, (1, 0)),  # Windows newline
+        ("ab\r\ncd", 6, (1, 2)),
+    ),
+)
+def test_widget_location_binary_index_roundtrip(text, byte_index, expected_location):
+    """Convert between UTF-8 byte indices and document locations across lines."""
+    w = make_widget(text)
+    assert w.get_location_from_binary_index(byte_index) == expected_location
+    assert w.get_binary_index_from_location(expected_location) == byte_index
+
+
+def test_widget_location_conversion_after_edit():
+    """Location conversions follow edits to the document."""
+    w = make_widget("ab\ncd")
+    assert w.get_binary_index_from_location((1, 1)) == 4
+
+    # insert a line before the second one
+    w.replace("\N{PALM TREE}\n", (1, 0), (1, 0), origin="remote")
+    assert w.document.text == "ab\n\N{PALM TREE}\ncd"
+
+    assert w.get_binary_index_from_location((2, 1)) == 9
+    assert w.get_location_from_binary_index(9) == (2, 1)
+
+    # replace the document altogether
+    w.load_text("x\ny")
+    assert w.get_location_from_binary_index(2) == (1, 0)
+
+
+def test_widget_line_starts_patched_after_edit():
+    """Line start tables patched after an edit match freshly measured ones."""
+    w = make_widget("ab\n\N{PALM TREE}\ncd\nef")
+    w.get_binary_index_from_location((0, 0))
+
+    # join the second and third line with a multi-line insert in between
+    w.replace("x\n\N{PALM TREE}y", (1, 1), (2, 1), origin="remote")
+    patched = w._get_line_starts()
+
+    w._line_starts = None
+    assert patched == w._get_line_starts()